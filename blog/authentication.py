@@ -0,0 +1,51 @@
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+
+# How long a resolved token stays cached (invalidated early by blog.signals)
+TOKEN_CACHE_TIMEOUT = 60 * 60
+
+
+def token_cache_key(key):
+    """
+    Cache key for a DRF auth token.
+    
+    Args:
+        key (str): The token key
+        
+    Returns:
+        str: Cache key holding the token and its user
+    """
+    return f'drf:tok:{key}'
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication that caches the token -> user lookup.
+    
+    DRF's TokenAuthentication queries the token and its user on every
+    authenticated request. Tokens rarely change, so the resolved token
+    (with its user) is kept in the cache. Signal handlers in blog.signals
+    drop the entry when the token or its user changes.
+    
+    Only enabled when the cache is shared between processes (Redis, see
+    TOKEN_AUTHENTICATION_CLASS in settings); with a per-process cache the
+    invalidation would not reach other workers.
+    """
+    
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        token = cache.get(cache_key)
+        
+        if token is None:
+            token = self.get_model().objects.select_related('user').filter(key=key).first()
+            if token is None:
+                raise exceptions.AuthenticationFailed(_('Invalid token.'))
+            cache.set(cache_key, token, TOKEN_CACHE_TIMEOUT)
+        
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+        
+        return (token.user, token)
@@ -0,0 +1,45 @@
+import hashlib
+import time
+
+from django.core.cache import caches
+from django.utils.connection import ConnectionProxy
+
+
+# Cache holding list pages (a DummyCache unless Redis is configured)
+ARTICLE_LIST_CACHE_ALIAS = 'article_lists'
+article_list_cache = ConnectionProxy(caches, ARTICLE_LIST_CACHE_ALIAS)
+
+# Seconds a serialized article list page is served from the cache
+ARTICLE_LIST_CACHE_TIMEOUT = 60
+
+# Every list key embeds this version; bumping it invalidates them all
+ARTICLE_LIST_VERSION_KEY = 'articles:list:version'
+
+
+def article_list_cache_key(kind, *parts):
+    """
+    Build a cache key for cached article list data.
+    
+    Keys embed the current list version, so invalidate_article_lists()
+    retires every key at once without needing pattern deletes (which
+    only django-redis supports).
+    
+    Args:
+        kind (str): What is cached (e.g. 'page')
+        *parts: Values identifying the list (endpoint, user, path, ...)
+    
+    Returns:
+        str: The cache key
+    """
+    version = article_list_cache.get_or_set(ARTICLE_LIST_VERSION_KEY, time.time_ns(), None)
+    digest = hashlib.md5(':'.join(map(str, parts)).encode()).hexdigest()
+    return f'articles:list:{version}:{kind}:{digest}'
+
+
+def invalidate_article_lists():
+    """
+    Retire all cached article list pages.
+    
+    Called whenever articles are created, changed or deleted.
+    """
+    article_list_cache.set(ARTICLE_LIST_VERSION_KEY, time.time_ns(), None)
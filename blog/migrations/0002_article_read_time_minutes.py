@@ -0,0 +1,32 @@
+# Generated by Django 4.1.3 on 2026-10-15 15:25
+
+from django.db import migrations, models
+
+
+def backfill_read_time(apps, schema_editor):
+    """
+    Compute read_time_minutes for existing articles (200 words per minute).
+    """
+    Article = apps.get_model('blog', 'Article')
+    articles = list(Article.objects.only('id', 'content'))
+    for article in articles:
+        word_count = len((article.content or '').split())
+        article.read_time_minutes = max(1, round(word_count / 200))
+    
+    Article.objects.bulk_update(articles, ['read_time_minutes'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='read_time_minutes',
+            field=models.PositiveSmallIntegerField(default=1, editable=False, help_text='Estimated reading time in minutes (derived from content)'),
+        ),
+        migrations.RunPython(backfill_read_time, migrations.RunPython.noop),
+    ]
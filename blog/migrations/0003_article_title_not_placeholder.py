@@ -0,0 +1,23 @@
+# Generated by Django 4.1.3 on 2026-10-15 15:26
+
+import blog.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_article_read_time_minutes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='article',
+            name='title',
+            field=models.CharField(help_text='The title of the article (max 200 characters)', max_length=200, validators=[blog.models.validate_title_not_placeholder]),
+        ),
+        migrations.AddConstraint(
+            model_name='article',
+            constraint=models.CheckConstraint(check=models.Q(('title__iregex', '^\\s*(untitled|new post|title|article)\\s*$'), _negated=True), name='article_title_not_placeholder'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.3 on 2026-10-15 15:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_article_title_not_placeholder'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='blog_articl_status_39d3b9_idx',
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('status', 'published')), fields=['-created_at'], name='published_articles_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.1.3 on 2026-10-15 15:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_author_username(apps, schema_editor):
+    """
+    Copy each author's username onto their existing articles.
+    """
+    Article = apps.get_model('blog', 'Article')
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    Article.objects.update(
+        author_username=models.Subquery(
+            User.objects.filter(pk=models.OuterRef('author_id')).values('username')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('blog', '0004_published_articles_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='author_username',
+            field=models.CharField(default='', editable=False, help_text='Username of the author (denormalized from the user)', max_length=150),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_author_username, migrations.RunPython.noop),
+    ]
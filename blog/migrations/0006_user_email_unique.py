@@ -0,0 +1,25 @@
+# Generated by Django 4.1.3 on 2026-10-15 15:50
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Enforce unique user emails in the database.
+    
+    auth.User.email isn't unique at the model level, so the index is
+    created directly. Blank emails (e.g. superusers created without one)
+    are left out of the index.
+    """
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('blog', '0005_article_author_username'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE UNIQUE INDEX auth_user_email_uniq ON auth_user (email) WHERE email <> '';",
+            reverse_sql="DROP INDEX auth_user_email_uniq;",
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.3 on 2026-10-15 15:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_user_email_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['author', '-created_at'], name='article_author_created_idx'),
+        ),
+    ]
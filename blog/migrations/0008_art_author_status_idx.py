@@ -0,0 +1,33 @@
+# Generated by Django 4.1.3 on 2026-10-15 15:34
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('blog', '0007_article_author_created_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='blog_articl_author__00152e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='article',
+            name='blog_articl_slug_cc8df7_idx',
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='author',
+            field=models.ForeignKey(db_index=False, help_text='The user who created this article', on_delete=django.db.models.deletion.CASCADE, related_name='articles', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['author', 'status', '-created_at'], name='art_author_status_idx'),
+        ),
+    ]
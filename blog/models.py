@@ -1,9 +1,74 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
 from django.contrib.auth.models import User
+from django.urls import reverse
 from django.utils.text import slugify
 from django.utils import timezone
 from django.core.exceptions import ValidationError
-import re
+import secrets
+
+
+# Titles rejected as placeholders (compared lowercased and stripped)
+PLACEHOLDER_TITLES = frozenset({'untitled', 'new post', 'title', 'article'})
+
+
+def validate_title_not_placeholder(value):
+    """
+    Reject placeholder titles like "Untitled" or "New Post".
+    
+    Attached to Article.title, so model forms and model serializers
+    pick it up automatically.
+    """
+    if value and value.lower().strip() in PLACEHOLDER_TITLES:
+        raise ValidationError(
+            'Title cannot be a placeholder like "Untitled" or "New Post".'
+        )
+
+
+class ArticleQuerySet(models.QuerySet):
+    """
+    QuerySet for the Article model.
+    
+    The author's username is stored on the article itself, so article
+    queries don't need to join the user table.
+    """
+    
+    # Columns read by the list serializers (everything but the body)
+    list_fields = (
+        'id',
+        'title',
+        'slug',
+        'status',
+        'author_username',
+        'created_at',
+        'updated_at',
+        'publish_date',
+        'read_time_minutes',
+    )
+    
+    def published(self):
+        """
+        Articles visible to the public.
+        """
+        return self.filter(status='published')
+    
+    def list_queryset(self):
+        """
+        Queryset for list endpoints.
+        
+        Loads only the columns the list serializers read, so the article
+        body is never fetched for list pages.
+        """
+        return self.only(*self.list_fields)
+
+
+class ArticleManager(models.Manager.from_queryset(ArticleQuerySet)):
+    """
+    Default manager for the Article model.
+    
+    Exposes the ArticleQuerySet methods, e.g.
+    Article.objects.published().list_queryset().
+    """
+
 
 class Article(models.Model):
     """
@@ -19,9 +84,13 @@ class Article(models.Model):
         ('published', 'Published'),
     ]
     
+    # Save attempts allowed when the generated slug is already taken
+    SLUG_SAVE_ATTEMPTS = 5
+    
     # Core content fields
     title = models.CharField(
         max_length=200,
+        validators=[validate_title_not_placeholder],
         help_text="The title of the article (max 200 characters)"
     )
     
@@ -49,9 +118,19 @@ class Article(models.Model):
         User,
         on_delete=models.CASCADE,
         related_name='articles',
+        # Covered by the (author, ...) composite indexes in Meta
+        db_index=False,
         help_text="The user who created this article"
     )
     
+    # Copy of author.username so reads don't need to join the user table;
+    # kept in sync by the post_save handler in blog.signals
+    author_username = models.CharField(
+        max_length=150,
+        editable=False,
+        help_text="Username of the author (denormalized from the user)"
+    )
+    
     # Optional future publishing date
     publish_date = models.DateTimeField(
         null=True,
@@ -59,6 +138,13 @@ class Article(models.Model):
         help_text="Optional future date when the article should be published"
     )
     
+    # Reading time derived from content, recomputed on save when content changes
+    read_time_minutes = models.PositiveSmallIntegerField(
+        default=1,
+        editable=False,
+        help_text="Estimated reading time in minutes (derived from content)"
+    )
+    
     # Automatic timestamp fields
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -70,6 +156,8 @@ class Article(models.Model):
         help_text="Timestamp when the article was last updated"
     )
     
+    objects = ArticleManager()
+    
     class Meta:
         """
         Meta options for the Article model.
@@ -79,15 +167,44 @@ class Article(models.Model):
         
         # Database indexes for better query performance
         indexes = [
-            models.Index(fields=['status', '-created_at']),  # For published articles list
-            models.Index(fields=['author', 'status']),       # For author's articles
-            models.Index(fields=['slug']),                   # For slug lookups
+            # For the published articles list (drafts are left out of the index)
+            models.Index(
+                fields=['-created_at'],
+                name='published_articles_idx',
+                condition=models.Q(status='published'),
+            ),
+            # For paging through one author's articles (newest first)
+            models.Index(fields=['author', '-created_at'], name='article_author_created_idx'),
+            # For paging through one author's published articles
+            models.Index(
+                fields=['author', 'status', '-created_at'],
+                name='art_author_status_idx',
+            ),
+            # Slug lookups use the index backing slug's unique constraint
+        ]
+        
+        # Database-level guard for writes that bypass validation
+        constraints = [
+            models.CheckConstraint(
+                check=~models.Q(title__iregex=r'^\s*(untitled|new post|title|article)\s*$'),
+                name='article_title_not_placeholder',
+            ),
         ]
         
         # Verbose names for admin interface
         verbose_name = 'Article'
         verbose_name_plural = 'Articles'
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the content as loaded so save() can tell if it changed.
+        """
+        instance = super().from_db(db, field_names, values)
+        # Deferred content isn't in __dict__; it can't have been changed
+        instance._original_content = instance.__dict__.get('content')
+        return instance
+    
     def __str__(self):
         """
         String representation of the Article model.
@@ -99,77 +216,85 @@ class Article(models.Model):
         """
         Custom validation method called during model validation.
 
-        Validates:
-        1. Title is not a placeholder
-        2. Publish date is in the future (if provided and status is draft)
+        Validates that the publish date is in the future (if provided and
+        status is draft). Placeholder titles are rejected by the title
+        field's validator.
         """
-        # Validate title is not a placeholder
-        placeholder_titles = ['untitled', 'new post', 'title', 'article']
-        if self.title and self.title.lower().strip() in placeholder_titles:
-            raise ValidationError({
-                'title': 'Title cannot be a placeholder like "Untitled" or "New Post".'
-            })
-
+        now = timezone.now()
+        
         # Only require future publish_date if status is draft
-        if self.status == 'draft' and self.publish_date and self.publish_date <= timezone.now():
+        if self.status == 'draft' and self.publish_date and self.publish_date <= now:
             raise ValidationError({
                 'publish_date': 'Publish date must be set to a future date.'
             })    
     def save(self, *args, **kwargs):
         """
-        Override the save method to automatically generate slug from title.
+        Override the save method to automatically generate slug from title,
+        record the author's username and keep the stored reading time in
+        sync with the content.
         
-        The slug is generated from the title and made unique by appending
-        a number if a duplicate exists.
+        The slug is taken straight from the title and the unique index on
+        slug decides whether it is free. On a collision a short random
+        suffix is appended and the save is retried.
         """
-        if not self.slug:
-            self.slug = self.generate_unique_slug()
+        # Only re-count words when the content was loaded and has changed
+        content_loaded = 'content' not in self.get_deferred_fields()
+        if content_loaded and self.content != getattr(self, '_original_content', None):
+            self.read_time_minutes = self.get_estimated_read_time()
+            self._original_content = self.content
+        
+        if not self.author_username:
+            self.author_username = self.author.username
         
-        # Call the model's clean method for validation
-        self.full_clean()
+        generate_slug = not self.slug
+        if generate_slug:
+            self.slug = self.generate_slug()
         
-        # Call the parent save method
-        super().save(*args, **kwargs)
+        # Input is validated by the serializers (and by clean() for model
+        # forms), so save() doesn't re-run full_clean() on every write.
+        if not generate_slug:
+            super().save(*args, **kwargs)
+            return
+        
+        attempts = 0
+        while True:
+            try:
+                # Savepoint so a slug collision doesn't break the outer transaction
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                attempts += 1
+                # Only retry slug collisions, not other constraint failures
+                slug_taken = Article.objects.filter(slug=self.slug).exclude(pk=self.pk).exists()
+                if not slug_taken or attempts >= self.SLUG_SAVE_ATTEMPTS:
+                    raise
+                self.slug = self.generate_slug(suffix=secrets.token_hex(3))
     
-    def generate_unique_slug(self):
+    def generate_slug(self, suffix=None):
         """
-        Generate a unique slug from the article title.
+        Generate a slug from the article title.
+        
+        Uniqueness is not checked here; save() relies on the unique index
+        and retries with a suffix when the slug is already taken.
         
-        If a slug already exists, append a number to make it unique.
+        Args:
+            suffix (str): Optional suffix appended to the title slug
         
         Returns:
-            str: A unique slug for the article
+            str: A slug for the article
         """
-        if not self.title:
-            return 'article'
-        
-        # Create base slug from title
-        base_slug = slugify(self.title)
+        # Create base slug from title, limited to prevent database issues
+        base_slug = slugify(self.title or '')[:200]
         
         # Ensure slug is not empty
         if not base_slug:
             base_slug = 'article'
         
-        # Limit slug length to prevent database issues
-        base_slug = base_slug[:200]
-        
-        # Check if this exact slug exists
-        unique_slug = base_slug
-        counter = 1
-        
-        # Keep checking until we find a unique slug
-        while Article.objects.filter(slug=unique_slug).exclude(pk=self.pk).exists():
-            unique_slug = f"{base_slug}-{counter}"
-            counter += 1
-            
-            # Prevent infinite loop by limiting attempts
-            if counter > 1000:
-                # Fallback to timestamp-based slug
-                import time
-                unique_slug = f"{base_slug}-{int(time.time())}"
-                break
+        if suffix:
+            return f"{base_slug}-{suffix}"
         
-        return unique_slug
+        return base_slug
     
     def get_estimated_read_time(self):
         """
@@ -183,8 +308,8 @@ class Article(models.Model):
         if not self.content:
             return 1
         
-        # Count words in content (simple word count)
-        word_count = len(re.findall(r'\b\w+\b', self.content))
+        # Count whitespace-separated words (str.split runs in C)
+        word_count = len(self.content.split())
         
         # Calculate reading time (200 words per minute)
         read_time = max(1, round(word_count / 200))
@@ -201,16 +326,6 @@ class Article(models.Model):
         """
         return self.status == 'published'
     
-    @property
-    def author_username(self):
-        """
-        Property to get the author's username.
-        
-        Returns:
-            str: Username of the article's author
-        """
-        return self.author.username if self.author else None
-    
     def get_absolute_url(self):
         """
         Get the absolute URL for this article.
@@ -218,4 +333,4 @@ class Article(models.Model):
         Returns:
             str: URL path for this article
         """
-        return f"/articles/{self.slug}/"
\ No newline at end of file
+        return reverse('public-article-slug-detail', kwargs={'slug': self.slug})
\ No newline at end of file
@@ -1,6 +1,11 @@
 from rest_framework import permissions
 
 
+# Looked up once per request on the public read path
+_SAFE = frozenset(permissions.SAFE_METHODS)
+_PUBLISHED = 'published'
+
+
 class IsAuthorOrReadOnly(permissions.BasePermission):
     """
     Custom permission to only allow authors of an article to edit it.
@@ -126,12 +131,14 @@ class IsPublishedOrAuthor(permissions.BasePermission):
         Returns:
             bool: True if permission is granted
         """
-        # If the article is published, anyone can read it
-        if request.method in permissions.SAFE_METHODS and obj.status == 'published':
+        # If the article is published, anyone can read it. Checked before
+        # touching request.user, which may hit the session or token store.
+        if obj.status == _PUBLISHED and request.method in _SAFE:
             return True
         
         # If the user is the author, they can access it regardless of status
-        if request.user and request.user.is_authenticated and obj.author == request.user:
+        user = request.user
+        if user and user.is_authenticated and obj.author_id == user.id:
             return True
         
         # Otherwise, deny access
@@ -1,5 +1,9 @@
+import copy
+from functools import cached_property
+
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from .models import Article
 
@@ -26,7 +30,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         model = User
         fields = ['id', 'username', 'email', 'password', 'password_confirm']
         extra_kwargs = {
-            'email': {'required': True},
+            'email': {'required': True, 'allow_blank': False},
             'username': {'help_text': 'Required. 150 characters or fewer.'}
         }
     
@@ -40,23 +44,27 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             })
         return attrs
     
-    def validate_email(self, value):
-        """
-        Validate that email is unique.
-        """
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError('A user with this email already exists.')
-        return value
-    
     def create(self, validated_data):
         """
         Create a new user with encrypted password.
+        
+        Email uniqueness is enforced by a unique index on auth_user.email
+        (see migration 0006), so a duplicate is reported from the failed
+        insert instead of being checked with a separate query first.
         """
         # Remove password_confirm from validated_data
         validated_data.pop('password_confirm')
         
         # Create user with encrypted password
-        user = User.objects.create_user(**validated_data)
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(**validated_data)
+        except IntegrityError:
+            if User.objects.filter(email=validated_data.get('email')).exists():
+                raise serializers.ValidationError({
+                    'email': ['A user with this email already exists.']
+                })
+            raise
         return user
 
 
@@ -76,15 +84,31 @@ class UserLoginSerializer(serializers.Serializer):
     )
 
 
-class ArticleListSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """
+    Build a model serializer's fields once per class.
+    
+    ModelSerializer introspects the model and Meta on every instantiation,
+    although the result only depends on the serializer class. The unbound
+    fields are built on first use and deep-copied for each new instance.
+    """
+    
+    def get_fields(self):
+        cls = type(self)
+        if '_cached_fields' not in cls.__dict__:
+            cls._cached_fields = super().get_fields()
+        return copy.deepcopy(cls._cached_fields)
+
+
+class ArticleListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for article list view (read-only).
     
     Used for displaying a list of published articles with minimal data
     and calculated fields like estimated read time.
     """
-    author_username = serializers.CharField(source='author.username', read_only=True)
-    estimated_read_time = serializers.SerializerMethodField()
+    author_username = serializers.CharField(read_only=True)
+    estimated_read_time = serializers.IntegerField(source='read_time_minutes', read_only=True)
     
     class Meta:
         model = Article
@@ -100,29 +124,17 @@ class ArticleListSerializer(serializers.ModelSerializer):
             'publish_date'
         ]
         read_only_fields = ['id', 'slug', 'created_at', 'updated_at']
-    
-    def get_estimated_read_time(self, obj):
-        """
-        Calculate estimated reading time for the article.
-        
-        Args:
-            obj (Article): The article instance
-            
-        Returns:
-            int: Estimated reading time in minutes
-        """
-        return obj.get_estimated_read_time()
 
 
-class ArticleDetailSerializer(serializers.ModelSerializer):
+class ArticleDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for article detail view (read-only).
     
     Used for displaying a single article with full content
     and all related information.
     """
-    author_username = serializers.CharField(source='author.username', read_only=True)
-    estimated_read_time = serializers.SerializerMethodField()
+    author_username = serializers.CharField(read_only=True)
+    estimated_read_time = serializers.IntegerField(source='read_time_minutes', read_only=True)
     
     class Meta:
         model = Article
@@ -139,25 +151,15 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
             'publish_date'
         ]
         read_only_fields = ['id', 'slug', 'created_at', 'updated_at', 'author_username']
-    
-    def get_estimated_read_time(self, obj):
-        """
-        Calculate estimated reading time for the article.
-        
-        Args:
-            obj (Article): The article instance
-            
-        Returns:
-            int: Estimated reading time in minutes
-        """
-        return obj.get_estimated_read_time()
 
 
-class ArticleCreateSerializer(serializers.ModelSerializer):
+class ArticleWriteSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
-    Serializer for creating new articles.
+    Base serializer for writing articles.
     
-    Handles article creation with validation and automatic author assignment.
+    Holds the fields and validation shared by the create and update
+    serializers. Placeholder titles are rejected by the model field's
+    validator, which ModelSerializer picks up automatically.
     """
     # Make slug read-only since it's auto-generated
     slug = serializers.SlugField(read_only=True)
@@ -180,25 +182,18 @@ class ArticleCreateSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'slug', 'author', 'created_at', 'updated_at']
     
-    def validate_title(self, value):
+    @cached_property
+    def validation_now(self):
         """
-        Validate that title is not a placeholder.
+        Reference time for date validation.
+        
+        Computed once per serializer. Bulk writes can pass a shared 'now'
+        in the context so every item is checked against one timestamp.
         
-        Args:
-            value (str): The title to validate
-            
         Returns:
-            str: The validated title
-            
-        Raises:
-            serializers.ValidationError: If title is a placeholder
+            datetime: The current time (timezone-aware)
         """
-        placeholder_titles = ['untitled', 'new post', 'title', 'article']
-        if value and value.lower().strip() in placeholder_titles:
-            raise serializers.ValidationError(
-                'Title cannot be a placeholder like "Untitled" or "New Post".'
-            )
-        return value
+        return self.context.get('now') or timezone.now()
     
     def validate_publish_date(self, value):
         """
@@ -213,11 +208,19 @@ class ArticleCreateSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: If date is not in the future
         """
-        if value and value <= timezone.now():
+        if value and value <= self.validation_now:
             raise serializers.ValidationError(
                 'Publish date must be set to a future date.'
             )
         return value
+
+
+class ArticleCreateSerializer(ArticleWriteSerializer):
+    """
+    Serializer for creating new articles.
+    
+    Handles article creation with validation and automatic author assignment.
+    """
     
     def create(self, validated_data):
         """
@@ -237,69 +240,13 @@ class ArticleCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class ArticleUpdateSerializer(serializers.ModelSerializer):
+class ArticleUpdateSerializer(ArticleWriteSerializer):
     """
     Serializer for updating existing articles.
     
-    Similar to create serializer but excludes fields that shouldn't be updated.
+    Same fields as the create serializer; regenerates the slug when the
+    title changes.
     """
-    # Make certain fields read-only
-    slug = serializers.SlugField(read_only=True)
-    author = serializers.PrimaryKeyRelatedField(read_only=True)
-    
-    class Meta:
-        model = Article
-        fields = [
-            'id',
-            'title',
-            'content',
-            'slug',
-            'status',
-            'author',
-            'publish_date',
-            'created_at',
-            'updated_at'
-        ]
-        read_only_fields = ['id', 'slug', 'author', 'created_at', 'updated_at']
-    
-    def validate_title(self, value):
-        """
-        Validate that title is not a placeholder.
-        
-        Args:
-            value (str): The title to validate
-            
-        Returns:
-            str: The validated title
-            
-        Raises:
-            serializers.ValidationError: If title is a placeholder
-        """
-        placeholder_titles = ['untitled', 'new post', 'title', 'article']
-        if value and value.lower().strip() in placeholder_titles:
-            raise serializers.ValidationError(
-                'Title cannot be a placeholder like "Untitled" or "New Post".'
-            )
-        return value
-    
-    def validate_publish_date(self, value):
-        """
-        Validate that publish_date is in the future.
-        
-        Args:
-            value (datetime): The publish date to validate
-            
-        Returns:
-            datetime: The validated publish date
-            
-        Raises:
-            serializers.ValidationError: If date is not in the future
-        """
-        if value and value <= timezone.now():
-            raise serializers.ValidationError(
-                'Publish date must be set to a future date.'
-            )
-        return value
     
     def update(self, instance, validated_data):
         """
@@ -327,40 +274,3 @@ class ArticleUpdateSerializer(serializers.ModelSerializer):
         instance.save()
         
         return instance
-
-
-class UserArticleSerializer(serializers.ModelSerializer):
-    """
-    Serializer for displaying a user's own articles.
-    
-    Shows all articles (draft and published) belonging to the authenticated user.
-    """
-    author_username = serializers.CharField(source='author.username', read_only=True)
-    estimated_read_time = serializers.SerializerMethodField()
-    
-    class Meta:
-        model = Article
-        fields = [
-            'id',
-            'title',
-            'slug',
-            'status',
-            'author_username',
-            'estimated_read_time',
-            'created_at',
-            'updated_at',
-            'publish_date'
-        ]
-        read_only_fields = ['id', 'slug', 'author_username', 'created_at', 'updated_at']
-    
-    def get_estimated_read_time(self, obj):
-        """
-        Calculate estimated reading time for the article.
-        
-        Args:
-            obj (Article): The article instance
-            
-        Returns:
-            int: Estimated reading time in minutes
-        """
-        return obj.get_estimated_read_time()
\ No newline at end of file
@@ -0,0 +1,84 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import token_cache_key
+from .caching import invalidate_article_lists
+from .models import Article
+
+
+# Sent once per batch of articles published with a bulk UPDATE (which
+# fires no post_save), with the published primary keys as ``pks``
+articles_published = Signal()
+
+
+@receiver(post_save, sender=User)
+def sync_author_username(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Copy a changed username onto the user's articles.
+    
+    Article.author_username is denormalized from the user; this keeps it
+    in sync with a single UPDATE that only touches stale rows.
+    """
+    if created:
+        return
+    
+    # Saves limited to other fields (e.g. last_login on login) can't rename
+    if update_fields is not None and 'username' not in update_fields:
+        return
+    
+    updated = Article.objects.filter(author=instance).exclude(
+        author_username=instance.username
+    ).update(author_username=instance.username)
+    if updated:
+        transaction.on_commit(invalidate_article_lists)
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+@receiver(articles_published, sender=Article)
+def invalidate_cached_article_lists(sender, **kwargs):
+    """
+    Drop cached article list pages after an article write.
+    
+    Deferred until the transaction commits; a list request served before
+    then would cache the old rows under the new version.
+    """
+    transaction.on_commit(invalidate_article_lists)
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_cached_token(sender, instance, **kwargs):
+    """
+    Drop a token from the authentication cache when it changes or is deleted.
+    
+    The entry is dropped now and again once the transaction commits: a
+    request that authenticates in between still reads the old row and
+    would otherwise put it back in the cache.
+    """
+    cache_key = token_cache_key(instance.key)
+    cache.delete(cache_key)
+    transaction.on_commit(lambda: cache.delete(cache_key))
+
+
+@receiver(post_save, sender=User)
+def invalidate_cached_user_tokens(sender, instance, created, **kwargs):
+    """
+    Drop a user's cached tokens so the next request sees the updated user
+    (e.g. a deactivated account or a new username).
+    """
+    if created:
+        return
+    
+    keys = Token.objects.filter(user=instance).values_list('key', flat=True)
+    cache_keys = [token_cache_key(key) for key in keys]
+    if not cache_keys:
+        return
+    
+    # Dropped again after commit, as in invalidate_cached_token()
+    cache.delete_many(cache_keys)
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
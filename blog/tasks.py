@@ -0,0 +1,43 @@
+from celery import shared_task
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Article
+from .signals import articles_published
+
+
+@shared_task
+def publish_scheduled_articles():
+    """
+    Publish all draft articles whose publish_date has passed.
+    
+    Runs periodically from Celery beat (see CELERY_BEAT_SCHEDULE) as a
+    single UPDATE, rather than loading and saving each article, followed
+    by one articles_published signal for the whole batch.
+    
+    Returns:
+        int: Number of articles published
+    """
+    now = timezone.now()
+    due = Article.objects.filter(
+        status='draft',
+        publish_date__isnull=False,
+        publish_date__lte=now
+    )
+    
+    with transaction.atomic():
+        # Lock the due rows so the batch can't change before the UPDATE
+        pks = list(due.select_for_update().values_list('pk', flat=True))
+        if not pks:
+            return 0
+        
+        # Keep the full due filter in case a row changed anyway
+        published = due.filter(pk__in=pks).update(
+            status='published', updated_at=now
+        )
+    
+    # update() sends no post_save; receivers get the whole batch at once
+    if published:
+        articles_published.send(sender=Article, pks=pks)
+    
+    return published
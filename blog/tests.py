@@ -1,3 +1,498 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from django.utils import timezone
+from rest_framework import exceptions, status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from .authentication import CachedTokenAuthentication, token_cache_key
+from .caching import article_list_cache
+from .models import Article
+from .signals import articles_published
+from .tasks import publish_scheduled_articles
+
+
+PASSWORD = 'pw123456!!'
+
+# Stand-in for the shared Redis caches used in production
+SHARED_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'article_lists': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'article-lists',
+    },
+}
+
+
+class UserRegistrationTests(APITestCase):
+    """
+    Tests for the registration endpoint.
+    """
+    
+    def register(self, username, email):
+        return self.client.post('/api/auth/register/', {
+            'username': username,
+            'email': email,
+            'password': PASSWORD,
+            'password_confirm': PASSWORD,
+        }, format='json')
+    
+    def setUp(self):
+        cache.clear()
+    
+    def test_register_returns_token(self):
+        response = self.register('alice', 'alice@example.com')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['user']['username'], 'alice')
+        self.assertTrue(response.json()['token'])
+    
+    def test_duplicate_email_is_rejected(self):
+        self.register('alice', 'alice@example.com')
+        response = self.register('alice2', 'alice@example.com')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', response.json())
+    
+    def test_blank_email_is_rejected(self):
+        response = self.register('alice', '')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', response.json())
+        self.assertFalse(User.objects.exists())
+
+
+class UserLoginTests(APITestCase):
+    """
+    Tests for the login endpoint.
+    """
+    
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('alice', 'alice@example.com', PASSWORD)
+    
+    def login(self):
+        return self.client.post('/api/auth/login/', {
+            'username': 'alice',
+            'password': PASSWORD,
+        }, format='json')
+    
+    def test_login_reuses_existing_token(self):
+        token = Token.objects.create(user=self.user)
+        response = self.login()
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['token'], token.key)
+    
+    def test_login_creates_token_on_first_login(self):
+        response = self.login()
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['token'], Token.objects.get(user=self.user).key)
+    
+    def test_concurrent_first_login_reuses_winning_token(self):
+        # Another request creates the token after our fast-path lookup missed
+        token = Token.objects.create(user=self.user)
+        missed = mock.MagicMock()
+        missed.only.return_value.first.return_value = None
+        with mock.patch.object(Token.objects, 'filter', return_value=missed):
+            response = self.login()
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['token'], token.key)
+    
+    def test_wrong_password_is_rejected(self):
+        response = self.client.post('/api/auth/login/', {
+            'username': 'alice',
+            'password': 'wrong',
+        }, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class TokenAuthenticationTests(APITestCase):
+    """
+    Tests for token authentication and the cached token lookup.
+    """
+    
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('alice', 'alice@example.com', PASSWORD)
+        self.token = Token.objects.create(user=self.user)
+    
+    def test_deactivated_user_loses_api_access(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        url = f'/api/articles/user_articles/{self.user.id}/'
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        
+        self.user.is_active = False
+        self.user.save()
+        
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_cached_token_is_reused(self):
+        auth = CachedTokenAuthentication()
+        auth.authenticate_credentials(self.token.key)
+        
+        with self.assertNumQueries(0):
+            user, token = auth.authenticate_credentials(self.token.key)
+        self.assertEqual(user, self.user)
+        self.assertEqual(token.key, self.token.key)
+    
+    def test_cached_token_rejects_deactivated_user(self):
+        auth = CachedTokenAuthentication()
+        auth.authenticate_credentials(self.token.key)
+        
+        self.user.is_active = False
+        self.user.save()
+        
+        self.assertIsNone(cache.get(token_cache_key(self.token.key)))
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            auth.authenticate_credentials(self.token.key)
+    
+    def test_cached_token_rejects_deleted_token(self):
+        auth = CachedTokenAuthentication()
+        auth.authenticate_credentials(self.token.key)
+        
+        self.token.delete()
+        
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            auth.authenticate_credentials(self.token.key)
+    
+    def test_token_revoked_in_transaction_is_dropped_after_commit(self):
+        auth = CachedTokenAuthentication()
+        cache_key = token_cache_key(self.token.key)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.token.delete()
+                # A concurrent request still sees the committed row and re-caches it
+                cache.set(cache_key, self.token)
+        
+        self.assertIsNone(cache.get(cache_key))
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            auth.authenticate_credentials(self.token.key)
+    
+    def test_user_deactivated_in_transaction_is_dropped_after_commit(self):
+        auth = CachedTokenAuthentication()
+        auth.authenticate_credentials(self.token.key)
+        stale = cache.get(token_cache_key(self.token.key))
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.user.is_active = False
+                self.user.save()
+                cache.set(token_cache_key(self.token.key), stale)
+        
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            auth.authenticate_credentials(self.token.key)
+
+
+@override_settings(CACHES=SHARED_CACHES)
+class ArticleListCacheTests(APITestCase):
+    """
+    Tests for the cached article list pages.
+    """
+    
+    def setUp(self):
+        article_list_cache.clear()
+        self.user = User.objects.create_user('alice', 'alice@example.com', PASSWORD)
+        for title in ('First article', 'Second article'):
+            Article.objects.create(
+                title=title, content='word ' * 50, author=self.user, status='published'
+            )
+    
+    def titles(self, url='/api/articles/public_articles/'):
+        return [article['title'] for article in self.client.get(url).json()['results']]
+    
+    def test_repeat_request_is_served_from_cache(self):
+        self.client.get('/api/articles/public_articles/')
+        
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/articles/public_articles/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_create_invalidates_lists(self):
+        self.titles()
+        self.client.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/api/articles/create/', {
+                'title': 'Third article', 'content': 'word', 'status': 'published'
+            }, format='json')
+        
+        self.assertIn('Third article', self.titles())
+    
+    def test_update_invalidates_lists(self):
+        article = Article.objects.get(title='First article')
+        self.titles()
+        self.client.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                f'/api/articles/user_articles/{self.user.id}/{article.pk}/',
+                {'title': 'Renamed article'}, format='json'
+            )
+        
+        self.assertIn('Renamed article', self.titles())
+    
+    def test_delete_invalidates_lists(self):
+        article = Article.objects.get(title='First article')
+        self.titles()
+        self.client.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f'/api/articles/user_articles/{self.user.id}/{article.pk}/')
+        
+        self.assertNotIn('First article', self.titles())
+    
+    def test_lists_are_invalidated_only_after_commit(self):
+        article = Article.objects.get(title='First article')
+        self.titles()
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                article.delete()
+                # The version isn't bumped until the delete is committed
+                self.assertIn('First article', self.titles())
+        
+        self.assertNotIn('First article', self.titles())
+    
+    def test_scheduled_publish_invalidates_lists(self):
+        Article.objects.create(
+            title='Scheduled article', content='word', author=self.user,
+            publish_date=timezone.now() - timedelta(minutes=1)
+        )
+        self.assertNotIn('Scheduled article', self.titles())
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            publish_scheduled_articles()
+        
+        self.assertIn('Scheduled article', self.titles())
+    
+    def test_page_links_follow_the_request_host(self):
+        url = '/api/articles/public_articles/?page_size=1'
+        first = self.client.get(url, HTTP_HOST='attacker.railway.app')
+        second = self.client.get(url, HTTP_HOST='inkwell.railway.app')
+        
+        self.assertTrue(first.json()['next'].startswith('http://attacker.railway.app/'))
+        self.assertTrue(second.json()['next'].startswith('http://inkwell.railway.app/'))
+
+
+class ArticleListWithoutSharedCacheTests(APITestCase):
+    """
+    Tests for list pages when no shared cache is configured.
+    """
+    
+    def test_list_pages_are_not_cached(self):
+        user = User.objects.create_user('alice', 'alice@example.com', PASSWORD)
+        Article.objects.create(title='First article', content='word', author=user, status='published')
+        self.client.get('/api/articles/public_articles/')
+        
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/articles/public_articles/')
+        self.assertEqual(len(response.json()['results']), 1)
+
+
+class AuthorUsernameSyncTests(APITestCase):
+    """
+    Tests for keeping Article.author_username in sync with the user.
+    """
+    
+    def setUp(self):
+        self.user = User.objects.create_user('alice', 'alice@example.com', PASSWORD)
+        self.article = Article.objects.create(
+            title='First article', content='word', author=self.user, status='published'
+        )
+    
+    def test_rename_is_shown_in_list_and_detail(self):
+        self.user.username = 'alicia'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        
+        listing = self.client.get('/api/articles/public_articles/').json()
+        detail = self.client.get(f'/api/articles/public_articles/{self.article.pk}/').json()
+        self.assertEqual(listing['results'][0]['author_username'], 'alicia')
+        self.assertEqual(detail['author_username'], 'alicia')
+    
+    def test_save_without_username_does_not_touch_articles(self):
+        self.user.last_login = timezone.now()
+        with CaptureQueriesContext(connection) as queries:
+            self.user.save(update_fields=['last_login'])
+        
+        article_updates = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('UPDATE "blog_article"')
+        ]
+        self.assertEqual(article_updates, [])
+
+
+class PublishScheduledArticlesTests(TestCase):
+    """
+    Tests for the scheduled publishing task.
+    """
+    
+    def setUp(self):
+        self.user = User.objects.create_user('alice', 'alice@example.com', PASSWORD)
+        now = timezone.now()
+        self.due = Article.objects.create(
+            title='Due article', content='word', author=self.user,
+            publish_date=now - timedelta(minutes=1)
+        )
+        self.later = Article.objects.create(
+            title='Later article', content='word', author=self.user,
+            publish_date=now + timedelta(days=1)
+        )
+        self.sent = []
+        articles_published.connect(self.record_signal)
+        self.addCleanup(articles_published.disconnect, self.record_signal)
+    
+    def record_signal(self, sender, pks, **kwargs):
+        self.sent.append(pks)
+    
+    def test_publishes_only_due_drafts(self):
+        self.assertEqual(publish_scheduled_articles(), 1)
+        
+        self.due.refresh_from_db()
+        self.later.refresh_from_db()
+        self.assertEqual(self.due.status, 'published')
+        self.assertEqual(self.later.status, 'draft')
+        self.assertEqual(self.sent, [[self.due.pk]])
+    
+    def test_sends_no_signal_when_nothing_is_due(self):
+        publish_scheduled_articles()
+        self.sent.clear()
+        
+        self.assertEqual(publish_scheduled_articles(), 0)
+        self.assertEqual(self.sent, [])
+
+
+class ArticleModelTests(TestCase):
+    """
+    Tests for Article.save() slug generation and title constraints.
+    """
+    
+    def setUp(self):
+        self.user = User.objects.create_user('alice', 'alice@example.com', PASSWORD)
+    
+    def create_article(self, title):
+        return Article.objects.create(title=title, content='word', author=self.user)
+    
+    def test_slug_is_taken_from_title(self):
+        self.assertEqual(self.create_article('Hello World').slug, 'hello-world')
+    
+    def test_slug_collision_gets_random_suffix(self):
+        self.create_article('Hello World')
+        second = self.create_article('Hello World')
+        
+        self.assertRegex(second.slug, r'^hello-world-[0-9a-f]{6}$')
+    
+    def test_placeholder_title_raises_without_retrying(self):
+        with mock.patch('blog.models.secrets.token_hex') as token_hex:
+            with self.assertRaises(IntegrityError):
+                self.create_article('Untitled')
+        
+        token_hex.assert_not_called()
+        self.assertFalse(Article.objects.exists())
+    
+    def test_read_time_follows_content(self):
+        article = Article.objects.create(
+            title='Long read', content='word ' * 1000, author=self.user
+        )
+        self.assertEqual(article.read_time_minutes, 5)
+        
+        article.content = 'word'
+        article.save()
+        self.assertEqual(article.read_time_minutes, 1)
+
+
+class ArticlePaginationTests(APITestCase):
+    """
+    Tests for cursor pagination of the public article list.
+    """
+    
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user('alice', 'alice@example.com', PASSWORD)
+        for number in range(5):
+            Article.objects.create(
+                title=f'Article {number}', content='word', author=user, status='published'
+            )
+        Article.objects.create(title='Draft article', content='word', author=user)
+    
+    def test_pages_cover_published_articles_newest_first(self):
+        titles = []
+        url = '/api/articles/public_articles/?page_size=2'
+        while url:
+            page = self.client.get(url).json()
+            self.assertLessEqual(len(page['results']), 2)
+            titles += [article['title'] for article in page['results']]
+            url = page['next']
+        
+        self.assertEqual(titles, [f'Article {number}' for number in range(4, -1, -1)])
+
+
+class ArticleDetailRoutingTests(APITestCase):
+    """
+    Tests for the pk and slug detail routes.
+    """
+    
+    def setUp(self):
+        self.alice = User.objects.create_user('alice', 'alice@example.com', PASSWORD)
+        self.bob = User.objects.create_user('bob', 'bob@example.com', PASSWORD)
+        self.published = Article.objects.create(
+            title='Published article', content='word', author=self.alice, status='published'
+        )
+        self.draft = Article.objects.create(
+            title='Draft article', content='word', author=self.alice
+        )
+    
+    def user_detail_url(self, lookup):
+        return f'/api/articles/user_articles/{self.alice.id}/{lookup}/'
+    
+    def test_public_detail_by_pk_and_slug(self):
+        for lookup in (self.published.pk, self.published.slug):
+            response = self.client.get(f'/api/articles/public_articles/{lookup}/')
+            
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()['id'], self.published.pk)
+    
+    def test_public_detail_hides_drafts_by_slug(self):
+        response = self.client.get(f'/api/articles/public_articles/{self.draft.slug}/')
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_public_detail_rejects_non_slug_paths(self):
+        response = self.client.get('/api/articles/public_articles/not.a.slug/')
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_owner_gets_own_draft_by_slug(self):
+        self.client.force_authenticate(self.alice)
+        response = self.client.get(self.user_detail_url(self.draft.slug))
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['id'], self.draft.pk)
+    
+    def test_other_user_gets_published_article_by_slug(self):
+        self.client.force_authenticate(self.bob)
+        response = self.client.get(self.user_detail_url(self.published.slug))
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['id'], self.published.pk)
+    
+    def test_other_users_draft_by_slug_is_not_found(self):
+        self.client.force_authenticate(self.bob)
+        response = self.client.get(self.user_detail_url(self.draft.slug))
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_absolute_url_resolves_to_the_article(self):
+        url = self.published.get_absolute_url()
+        
+        self.assertEqual(resolve(url).url_name, 'public-article-slug-detail')
+        self.assertEqual(self.client.get(url).json()['id'], self.published.pk)
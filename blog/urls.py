@@ -15,11 +15,13 @@ urlpatterns = [
     
     # Public article endpoints (no authentication required)
     path('articles/public_articles/', PublicArticleListView.as_view(), name='public-article-list'),
-    path('articles/public_articles/<str:pk>/', PublicArticleDetailView.as_view(), name='public-article-detail'),
+    path('articles/public_articles/<int:pk>/', PublicArticleDetailView.as_view(), name='public-article-detail'),
+    path('articles/public_articles/<slug:slug>/', PublicArticleDetailView.as_view(), name='public-article-slug-detail'),
     
     # User article endpoints (authentication required)
     path('articles/user_articles/<int:user_id>/', UserArticleListView.as_view(), name='user-article-list'),
-    path('articles/user_articles/<int:user_id>/<str:pk>/', UserArticleDetailView.as_view(), name='user-article-detail'),
+    path('articles/user_articles/<int:user_id>/<int:pk>/', UserArticleDetailView.as_view(), name='user-article-detail'),
+    path('articles/user_articles/<int:user_id>/<slug:slug>/', UserArticleDetailView.as_view(), name='user-article-slug-detail'),
     
     # Article creation endpoint
     path('articles/create/', CreateArticleView.as_view(), name='create-article'),
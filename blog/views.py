@@ -3,13 +3,17 @@ from rest_framework.views import APIView
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
 from django.contrib.auth import authenticate
-from django.contrib.auth.models import User
-from django.db.models import Q
-from django.shortcuts import get_object_or_404
-from django.utils import timezone
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse
+import orjson
 
+from .caching import (
+    ARTICLE_LIST_CACHE_TIMEOUT,
+    article_list_cache,
+    article_list_cache_key,
+)
 from .models import Article
 from .serializers import (
     UserRegistrationSerializer,
@@ -17,34 +21,42 @@ from .serializers import (
     ArticleListSerializer,
     ArticleDetailSerializer,
     ArticleCreateSerializer,
-    ArticleUpdateSerializer,
-    UserArticleSerializer
+    ArticleUpdateSerializer
 )
 from .permissions import IsAuthorOrReadOnly, IsOwnerOrCreateOnly, IsPublishedOrAuthor
 
 
-class ArticlePagination(PageNumberPagination):
+def _json_response(data, status=200):
     """
-    Custom pagination class for articles.
+    Build a JSON response encoded with orjson.
+    
+    Used on the hot read paths instead of DRF's Response, which goes
+    through content negotiation and the stdlib JSON encoder.
+    
+    Args:
+        data: Serialized data, or JSON bytes that are already encoded
+        status (int): HTTP status code
+        
+    Returns:
+        HttpResponse: The JSON response
     """
-    page_size = 10
-    page_size_query_param = 'page_size'
-    max_page_size = 50
+    if not isinstance(data, bytes):
+        data = orjson.dumps(data)
+    return HttpResponse(data, content_type='application/json', status=status)
 
 
-def publish_scheduled_articles():
+class ArticleCursorPagination(CursorPagination):
     """
-    Update all draft articles whose publish_date has passed to published.
+    Cursor pagination for article lists.
+    
+    Seeks on created_at instead of using OFFSET, so deep pages cost the
+    same as the first one and no COUNT(*) is needed.
     """
-    now = timezone.now()
-    articles = Article.objects.filter(
-        status='draft',
-        publish_date__isnull=False,
-        publish_date__lte=now
-    )
-    for article in articles:
-        article.status = 'published'
-        article.save()
+    ordering = '-created_at'
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+    cursor_query_param = 'cursor'
 
 
 class UserAuthViewSet(viewsets.ViewSet):
@@ -59,9 +71,10 @@ class UserAuthViewSet(viewsets.ViewSet):
         
         if serializer.is_valid():
             user = serializer.save()
-            token, created = Token.objects.get_or_create(user=user)
+            # A brand-new user can't have a token yet
+            token = Token.objects.create(user=user)
             
-            return Response({
+            return _json_response({
                 'message': 'User registered successfully',
                 'user': {
                     'id': user.id,
@@ -84,9 +97,17 @@ class UserAuthViewSet(viewsets.ViewSet):
             user = authenticate(username=username, password=password)
             
             if user:
-                token, created = Token.objects.get_or_create(user=user)
+                # Reuse the existing token; create one only on first login
+                token = Token.objects.filter(user_id=user.id).only('key').first()
+                if token is None:
+                    try:
+                        with transaction.atomic():
+                            token = Token.objects.create(user=user)
+                    except IntegrityError:
+                        # A concurrent first login created it first
+                        token = Token.objects.get(user_id=user.id)
                 
-                return Response({
+                return _json_response({
                     'message': 'Login successful',
                     'user': {
                         'id': user.id,
@@ -110,16 +131,23 @@ class PublicArticleListView(APIView):
     GET /articles/public_articles/
     """
     permission_classes = [permissions.AllowAny]
-    pagination_class = ArticlePagination
+    pagination_class = ArticleCursorPagination
     
     def get(self, request):
         """
         Return a list of all published articles.
+        
+        Pages are served from the cache for a short time; any article
+        write invalidates them. The key uses the absolute URL because the
+        cached next/previous links embed the request's scheme and host.
         """
-        publish_scheduled_articles()
+        cache_key = article_list_cache_key('page', request.build_absolute_uri())
+        content = article_list_cache.get(cache_key)
+        if content is not None:
+            return _json_response(content)
         
         # Get all published articles
-        queryset = Article.objects.filter(status='published').select_related('author')
+        queryset = Article.objects.published().list_queryset()
         
         # Apply pagination
         paginator = self.pagination_class()
@@ -127,45 +155,50 @@ class PublicArticleListView(APIView):
         
         if page is not None:
             serializer = ArticleListSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
+            data = paginator.get_paginated_response(serializer.data).data
+        else:
+            data = ArticleListSerializer(queryset, many=True).data
         
-        serializer = ArticleListSerializer(queryset, many=True)
-        return Response(serializer.data)
+        # Cache the encoded page so hits skip serialization entirely
+        content = orjson.dumps(data)
+        article_list_cache.set(cache_key, content, ARTICLE_LIST_CACHE_TIMEOUT)
+        return _json_response(content)
 
 
 class PublicArticleDetailView(APIView):
     """
     API view for retrieving a specific published article (public access).
     
-    GET /articles/public_articles/<pk>/
+    GET /articles/public_articles/<pk or slug>/
     """
     permission_classes = [permissions.AllowAny]
     
-    def get(self, request, pk):
+    def _get_article_by(self, **lookup):
+        """
+        Get a published article by the lookup captured from the URL.
+        
+        Args:
+            **lookup: Either pk=<int> or slug=<str>
+            
+        Returns:
+            Article or None: The article, if it exists and is published
+        """
+        return Article.objects.published().filter(**lookup).first()
+    
+    def get(self, request, **lookup):
         """
         Return a specific published article by pk or slug.
         """
-        publish_scheduled_articles()
-        
-        try:
-            # Try to get by pk first, then by slug
-            if pk.isdigit():
-                article = Article.objects.select_related('author').get(
-                    pk=pk, status='published'
-                )
-            else:
-                article = Article.objects.select_related('author').get(
-                    slug=pk, status='published'
-                )
-            
-            serializer = ArticleDetailSerializer(article)
-            return Response(serializer.data)
-            
-        except Article.DoesNotExist:
-            return Response(
+        article = self._get_article_by(**lookup)
+        
+        if article is None:
+            return _json_response(
                 {'error': 'Article not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        
+        serializer = ArticleDetailSerializer(article)
+        return _json_response(serializer.data)
 
 
 class UserArticleListView(APIView):
@@ -175,117 +208,114 @@ class UserArticleListView(APIView):
     GET /articles/user_articles/<user_id>/
     """
     permission_classes = [permissions.IsAuthenticated]
-    pagination_class = ArticlePagination
+    pagination_class = ArticleCursorPagination
     
     def get(self, request, user_id):
         """
         Return articles for a specific user.
         If it's the current user, return all articles (draft + published).
         If it's another user, return only published articles.
-        """
-        publish_scheduled_articles()
         
-        # Get the target user
-        target_user = get_object_or_404(User, id=user_id)
+        Pages are cached per requesting user, since owners also see drafts.
+        """
+        cache_key = article_list_cache_key(
+            'page', request.build_absolute_uri(), request.user.pk
+        )
+        content = article_list_cache.get(cache_key)
+        if content is not None:
+            return _json_response(content)
         
-        # Check if requesting user is the same as target user
-        if request.user.id == int(user_id):
-            # Own articles - show all (draft + published)
-            queryset = Article.objects.filter(author=target_user).select_related('author')
-            serializer_class = UserArticleSerializer
-        else:
+        # An unknown user_id simply matches no articles
+        queryset = Article.objects.list_queryset().filter(author_id=user_id)
+        if request.user.id != user_id:
             # Other user's articles - show only published
-            queryset = Article.objects.filter(
-                author=target_user, status='published'
-            ).select_related('author')
-            serializer_class = ArticleListSerializer
+            queryset = queryset.published()
         
         # Apply pagination
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(queryset, request)
         
         if page is not None:
-            serializer = serializer_class(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
+            serializer = ArticleListSerializer(page, many=True)
+            data = paginator.get_paginated_response(serializer.data).data
+        else:
+            data = ArticleListSerializer(queryset, many=True).data
         
-        serializer = serializer_class(queryset, many=True)
-        return Response(serializer.data)
+        # Cache the encoded page so hits skip serialization entirely
+        content = orjson.dumps(data)
+        article_list_cache.set(cache_key, content, ARTICLE_LIST_CACHE_TIMEOUT)
+        return _json_response(content)
 
 
 class UserArticleDetailView(APIView):
     """
     API view for retrieving, updating, and deleting user's articles.
     
-    GET /articles/user_articles/<user_id>/<pk>/
-    PUT /articles/user_articles/<user_id>/<pk>/
-    PATCH /articles/user_articles/<user_id>/<pk>/
-    DELETE /articles/user_articles/<user_id>/<pk>/
+    GET /articles/user_articles/<user_id>/<pk or slug>/
+    PUT /articles/user_articles/<user_id>/<pk or slug>/
+    PATCH /articles/user_articles/<user_id>/<pk or slug>/
+    DELETE /articles/user_articles/<user_id>/<pk or slug>/
     """
     permission_classes = [permissions.IsAuthenticated]
     
-    def get_article(self, user_id, pk, request_user):
+    def _get_article_by(self, user_id, request_user, **lookup):
         """
         Get article with proper permission checking.
-        """
-        target_user = get_object_or_404(User, id=user_id)
         
-        try:
-            if pk.isdigit():
-                article = Article.objects.select_related('author').get(
-                    pk=pk, author=target_user
-                )
-            else:
-                article = Article.objects.select_related('author').get(
-                    slug=pk, author=target_user
-                )
+        The article is looked up by id or slug among the user's articles in
+        a single query; an unknown user simply has no matching article.
+        
+        Args:
+            user_id (int): Author whose articles are searched
+            request_user (User): The requesting user
+            **lookup: Either pk=<int> or slug=<str>, as captured from the URL
             
-            # Permission check
-            if request_user.id == int(user_id):
-                # Own article - can see all
-                return article
-            else:
-                # Other user's article - only if published
-                if article.status == 'published':
-                    return article
-                else:
-                    return None
-        except Article.DoesNotExist:
+        Returns:
+            Article or None: The article, if the requesting user may see it
+        """
+        article = Article.objects.filter(author_id=user_id, **lookup).first()
+        
+        if article is None:
             return None
+        
+        # Permission check
+        if request_user.id == user_id:
+            # Own article - can see all
+            return article
+        
+        # Other user's article - only if published
+        if article.status == 'published':
+            return article
+        
+        return None
     
-    def get(self, request, user_id, pk):
+    def get(self, request, user_id, **lookup):
         """
         Retrieve a specific article.
         """
-        publish_scheduled_articles()
-        
-        article = self.get_article(user_id, pk, request.user)
+        article = self._get_article_by(user_id, request.user, **lookup)
         
         if not article:
-            return Response(
+            return _json_response(
                 {'error': 'Article not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Use appropriate serializer based on ownership
-        if request.user.id == int(user_id):
-            serializer = ArticleDetailSerializer(article)
-        else:
-            serializer = ArticleDetailSerializer(article)
-        
-        return Response(serializer.data)
+        serializer = ArticleDetailSerializer(article)
+        return _json_response(serializer.data)
     
-    def put(self, request, user_id, pk):
+    def put(self, request, user_id, **lookup):
         """
         Fully update an article (only owner can update).
         """
         # Only allow owner to update
-        if request.user.id != int(user_id):
+        if request.user.id != user_id:
             return Response(
                 {'error': 'You can only edit your own articles'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        article = self.get_article(user_id, pk, request.user)
+        article = self._get_article_by(user_id, request.user, **lookup)
         
         if not article:
             return Response(
@@ -303,18 +333,18 @@ class UserArticleDetailView(APIView):
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
-    def patch(self, request, user_id, pk):
+    def patch(self, request, user_id, **lookup):
         """
         Partially update an article (only owner can update).
         """
         # Only allow owner to update
-        if request.user.id != int(user_id):
+        if request.user.id != user_id:
             return Response(
                 {'error': 'You can only edit your own articles'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        article = self.get_article(user_id, pk, request.user)
+        article = self._get_article_by(user_id, request.user, **lookup)
         
         if not article:
             return Response(
@@ -332,18 +362,18 @@ class UserArticleDetailView(APIView):
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
-    def delete(self, request, user_id, pk):
+    def delete(self, request, user_id, **lookup):
         """
         Delete an article (only owner can delete).
         """
         # Only allow owner to delete
-        if request.user.id != int(user_id):
+        if request.user.id != user_id:
             return Response(
                 {'error': 'You can only delete your own articles'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        article = self.get_article(user_id, pk, request.user)
+        article = self._get_article_by(user_id, request.user, **lookup)
         
         if not article:
             return Response(
@@ -0,0 +1,16 @@
+"""
+Celery application for the inkwell project.
+
+Workers and beat are started with ``celery -A inkwell ...``; settings
+prefixed with ``CELERY_`` in inkwell/settings.py configure the app.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'inkwell.settings')
+
+app = Celery('inkwell')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -87,6 +87,48 @@ else:
             'NAME': BASE_DIR / 'db.sqlite3',
         }
     }
+
+# Cache - Redis when REDIS_URL is provided, local memory otherwise
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': REDIS_URL,
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            },
+        },
+        # Rendered article list pages (see blog.caching)
+        'article_lists': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': REDIS_URL,
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            },
+        },
+    }
+    # Keep sessions in Redis too; LocMem is per-process, so the
+    # database-backed default stays in place without Redis
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
+    SESSION_CACHE_ALIAS = 'default'
+    # Cached tokens are only safe to use when every process sees the
+    # same cache, so signal-driven invalidation reaches all of them
+    TOKEN_AUTHENTICATION_CLASS = 'blog.authentication.CachedTokenAuthentication'
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+        # List invalidation would only reach the current process, so list
+        # pages aren't cached at all without Redis
+        'article_lists': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        },
+    }
+    TOKEN_AUTHENTICATION_CLASS = 'rest_framework.authentication.TokenAuthentication'
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -163,7 +205,7 @@ CORS_ALLOW_HEADERS = [
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        TOKEN_AUTHENTICATION_CLASS,
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -195,6 +237,18 @@ REST_FRAMEWORK = {
     },
 }
 
+# Celery Configuration
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default=REDIS_URL or 'redis://localhost:6379/0')
+CELERY_TIMEZONE = TIME_ZONE
+
+CELERY_BEAT_SCHEDULE = {
+    # Publish scheduled drafts once their publish_date has passed
+    'publish-scheduled-articles': {
+        'task': 'blog.tasks.publish_scheduled_articles',
+        'schedule': 60.0,
+    },
+}
+
 # Security Settings for Production
 if not DEBUG:
     SECURE_BROWSER_XSS_FILTER = True
@@ -13,37 +13,43 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+import json
+
 from django.contrib import admin
 from django.urls import path, include
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
+
+# The API root is static, so its JSON body is encoded once at import
+_API_ROOT_BYTES = json.dumps({
+    'message': 'Welcome to Inkwell API',
+    'version': '1.0',
+    'endpoints': {
+        'authentication': {
+            'register': '/api/auth/register/',
+            'login': '/api/auth/login/',
+        },
+        'articles': {
+            'list_published': '/api/articles/',
+            'create': '/api/articles/',
+            'detail': '/api/articles/{id_or_slug}/',
+            'update': '/api/articles/{id}/',
+            'delete': '/api/articles/{id}/',
+            'my_articles': '/api/articles/my_articles/',
+        }
+    },
+    'authentication': 'Token-based authentication required for write operations',
+    'documentation': 'Include Authorization header: Token <your-token-here>'
+}).encode()
+
 
 def api_root(request):
     """
     API root endpoint that provides information about available endpoints.
     
     Returns:
-        JsonResponse: Information about the API and available endpoints
+        HttpResponse: Information about the API and available endpoints (JSON)
     """
-    return JsonResponse({
-        'message': 'Welcome to Inkwell API',
-        'version': '1.0',
-        'endpoints': {
-            'authentication': {
-                'register': '/api/auth/register/',
-                'login': '/api/auth/login/',
-            },
-            'articles': {
-                'list_published': '/api/articles/',
-                'create': '/api/articles/',
-                'detail': '/api/articles/{id_or_slug}/',
-                'update': '/api/articles/{id}/',
-                'delete': '/api/articles/{id}/',
-                'my_articles': '/api/articles/my_articles/',
-            }
-        },
-        'authentication': 'Token-based authentication required for write operations',
-        'documentation': 'Include Authorization header: Token <your-token-here>'
-    })
+    return HttpResponse(_API_ROOT_BYTES, content_type='application/json')
 
 urlpatterns = [
     # Django admin interface